@@ -0,0 +1,113 @@
+"""Measure fleet mode tick latency against a local mock Zoom API
+
+Starts a threaded HTTP server that answers the OAuth token and live meeting
+list endpoints, points a ZoomFleetMonitor at it and drives its tick directly,
+reporting how long each tick takes and how many hosts were polled.
+
+    python scripts/fleet_mock_benchmark.py --hosts 500 --rps 200 --seconds 10
+
+Needs the same dependencies as the app (see requirements.txt).
+"""
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt6.QtCore import QCoreApplication
+from zoom_recording_prompt import Config, ZoomAPI, ZoomFleetMonitor
+
+
+def make_handler(latency, live_every):
+    class MockZoomHandler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def log_message(self, format, *args):
+            pass
+
+        def _send_json(self, body):
+            payload = json.dumps(body).encode()
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def do_POST(self):
+            self.rfile.read(int(self.headers.get('Content-Length', 0)))
+            self._send_json({'access_token': 'mock-token', 'expires_in': 3600})
+
+        def do_GET(self):
+            # /v2/users/<user_id>/meetings?type=live
+            user_id = self.path.split('/')[3]
+            host_number = int(user_id.lstrip('user'))
+            time.sleep(latency)
+            meetings = []
+            if host_number % live_every == 0:
+                meetings.append({'id': host_number, 'topic': f"Meeting of {user_id}"})
+            self._send_json({'meetings': meetings})
+
+    return MockZoomHandler
+
+
+def percentile(sorted_values, fraction):
+    return sorted_values[min(int(len(sorted_values) * fraction), len(sorted_values) - 1)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--hosts', type=int, default=500, help="number of monitored hosts (default: 500)")
+    parser.add_argument('--rps', type=float, default=200, help="fleet request budget per second (default: 200)")
+    parser.add_argument('--workers', type=int, default=16, help="concurrent requests (default: 16)")
+    parser.add_argument('--seconds', type=float, default=10, help="how long to run (default: 10)")
+    parser.add_argument('--tick-ms', type=float, default=50, help="time between ticks (default: 50)")
+    parser.add_argument('--latency-ms', type=float, default=20, help="mock server response delay (default: 20)")
+    parser.add_argument('--live-every', type=int, default=50, help="every Nth host is in a meeting (default: 50)")
+    parser.add_argument('--max-p99-ms', type=float, help="exit with status 1 if p99 tick latency exceeds this")
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), make_handler(args.latency_ms / 1000, args.live_every))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_port}"
+
+    app = QCoreApplication(sys.argv[:1])
+    zoom_api = ZoomAPI(Config(), pool_size=args.workers)
+    zoom_api.base_url = f"{base}/v2"
+    zoom_api.token_url = f"{base}/oauth/token"
+    monitor = ZoomFleetMonitor(zoom_api, [f"user{i}" for i in range(args.hosts)],
+                               requests_per_second=args.rps, max_workers=args.workers)
+    # Drive ticks ourselves so each one can be timed
+    monitor.poll_timer.stop()
+
+    tick_times = []
+    finish = time.monotonic() + args.seconds
+    while time.monotonic() < finish:
+        started = time.perf_counter()
+        monitor.tick()
+        tick_times.append(time.perf_counter() - started)
+        app.processEvents()
+        time.sleep(args.tick_ms / 1000)
+
+    monitor.executor.shutdown(wait=True)
+    server.shutdown()
+
+    tick_times.sort()
+    polled = sum(1 for state in monitor.hosts.values() if state.last_polled)
+    live = sum(1 for state in monitor.hosts.values() if state.live_meeting_ids)
+    p99_ms = percentile(tick_times, 0.99) * 1000
+    print(f"hosts: {args.hosts}  polled: {polled}  in meetings: {live}  ticks: {len(tick_times)}")
+    print(f"tick latency ms: p50 {percentile(tick_times, 0.5) * 1000:.2f}  "
+          f"p95 {percentile(tick_times, 0.95) * 1000:.2f}  p99 {p99_ms:.2f}  "
+          f"max {tick_times[-1] * 1000:.2f}")
+
+    if args.max_p99_ms is not None and p99_ms > args.max_p99_ms:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
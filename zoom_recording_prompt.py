@@ -4,14 +4,33 @@ import psutil
 import pyautogui
 import requests
 import logging
+import threading
+import time
+import signal
+import cProfile
+import pstats
+import io
+import tracemalloc
 from datetime import datetime, timedelta, UTC
 from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
                             QPushButton, QLabel, QSpinBox, QHBoxLayout,
                             QButtonGroup, QRadioButton, QSpacerItem, QSizePolicy)
-from PyQt6.QtCore import Qt, QTimer
-from dotenv import load_dotenv
+from PyQt6.QtCore import Qt, QTimer, QCoreApplication, QFileSystemWatcher
+from dotenv import dotenv_values, find_dotenv
 import base64
+import gzip
+import json
+import atexit
+import argparse
+import bisect
+import heapq
+import hashlib
+from urllib.parse import urlsplit
+from email.utils import parsedate_to_datetime
+from dataclasses import dataclass
 
 # Set up logging
 logging.basicConfig(
@@ -24,23 +43,237 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+def default_env_path():
+    """Path of the .env file: the nearest one above this script, else next to it"""
+    return find_dotenv() or os.path.join(os.path.dirname(os.path.abspath(__file__)), '.env')
+
+@dataclass(frozen=True)
+class Config:
+    """Immutable snapshot of the settings from the environment and .env
+
+    Variables set in the real environment take precedence over .env, as with
+    load_dotenv. A new snapshot is built on every reload; nothing mutates one.
+    """
+    account_id: str | None = None
+    client_id: str | None = None
+    client_secret: str | None = None
+    check_interval: int = 5
+    default_snooze_time: int = 2
+    enable_api: bool = True
+    trace_file: str | None = None
+    profile_ticks: int = 10
+    profile_dir: str = 'profiles'
+    profile_on_start: bool = False
+    profile_memory_from_start: bool = False
+    fleet_user_ids: tuple = ()
+    fleet_requests_per_second: float = 10.0
+    fleet_max_workers: int = 8
+    fleet_notify_url: str | None = None
+
+    def __post_init__(self):
+        """Reject values that would misbehave, so a bad reload keeps the old snapshot"""
+        if self.check_interval < 1:
+            raise ValueError(f"CHECK_INTERVAL must be at least 1 second, got {self.check_interval}")
+        if not 1 <= self.default_snooze_time <= 60:
+            raise ValueError(f"DEFAULT_SNOOZE_TIME must be between 1 and 60 minutes, got {self.default_snooze_time}")
+        if self.profile_ticks < 1:
+            raise ValueError(f"PROFILE_TICKS must be at least 1, got {self.profile_ticks}")
+        if self.fleet_requests_per_second <= 0:
+            raise ValueError(f"FLEET_REQUESTS_PER_SECOND must be positive, got {self.fleet_requests_per_second}")
+        if self.fleet_max_workers < 1:
+            raise ValueError(f"FLEET_MAX_WORKERS must be at least 1, got {self.fleet_max_workers}")
+
+    @classmethod
+    def load(cls, env_path=None):
+        """Build a snapshot, raising ValueError if a setting cannot be parsed"""
+        env_path = env_path or default_env_path()
+        values = {}
+        if os.path.exists(env_path):
+            # Keys written without a value (e.g. a bare "DEBUG") parse as None
+            values.update((key, value) for key, value in dotenv_values(env_path).items()
+                          if value is not None)
+        values.update(os.environ)
+
+        def get_bool(name, default):
+            return values.get(name, default).lower() == 'true'
+
+        # Fleet hosts come from FLEET_USER_IDS and the file named by FLEET_USERS_FILE
+        user_ids = [user_id.strip() for user_id in values.get('FLEET_USER_IDS', '').split(',')]
+        users_file = values.get('FLEET_USERS_FILE')
+        if users_file:
+            with open(users_file) as f:
+                user_ids.extend(line.strip() for line in f)
+
+        return cls(
+            account_id=values.get('ZOOM_ACCOUNT_ID'),
+            client_id=values.get('ZOOM_CLIENT_ID'),
+            client_secret=values.get('ZOOM_CLIENT_SECRET'),
+            check_interval=int(values.get('CHECK_INTERVAL', 5)),
+            default_snooze_time=int(values.get('DEFAULT_SNOOZE_TIME', 2)),
+            enable_api=get_bool('ENABLE_API', 'true'),
+            trace_file=values.get('ZOOM_TRACE_FILE') or None,
+            profile_ticks=int(values.get('PROFILE_TICKS', 10)),
+            profile_dir=values.get('PROFILE_DIR', 'profiles'),
+            profile_on_start=get_bool('PROFILE_ON_START', 'false'),
+            profile_memory_from_start=get_bool('PROFILE_MEMORY_FROM_START', 'false'),
+            # Drop blanks and duplicates while keeping the configured order
+            fleet_user_ids=tuple(dict.fromkeys(user_id for user_id in user_ids if user_id)),
+            fleet_requests_per_second=float(values.get('FLEET_REQUESTS_PER_SECOND', 10)),
+            fleet_max_workers=int(values.get('FLEET_MAX_WORKERS', 8)),
+            fleet_notify_url=values.get('FLEET_NOTIFY_URL') or None
+        )
+
+class ConfigWatcher:
+    """Reload the config when .env changes and pass the new snapshot to listeners
+
+    QFileSystemWatcher (inotify/kqueue) wakes us up; the mtime check filters out
+    unrelated directory events before anything is parsed. A slow timer repeats
+    the mtime check in case a file system event is missed.
+    """
+    def __init__(self, config, env_path=None, poll_interval=10000):
+        self.config = config
+        self.env_path = os.path.abspath(env_path or default_env_path())
+        self.listeners = []
+        self._stat = self._read_stat()
+
+        # Watch the directory too so a .env that is created or replaced is noticed
+        self.watcher = QFileSystemWatcher()
+        self.watcher.addPath(os.path.dirname(self.env_path))
+        if os.path.exists(self.env_path):
+            self.watcher.addPath(self.env_path)
+        self.watcher.fileChanged.connect(self._on_change)
+        self.watcher.directoryChanged.connect(self._on_change)
+
+        self.poll_timer = QTimer()
+        self.poll_timer.timeout.connect(lambda: self._on_change(self.env_path))
+        self.poll_timer.start(poll_interval)
+        logger.info("Watching %s for config changes", self.env_path)
+
+    def _read_stat(self):
+        try:
+            stat = os.stat(self.env_path)
+            return stat.st_ino, stat.st_mtime_ns, stat.st_size
+        except OSError:
+            return None
+
+    def _on_change(self, path):
+        current_stat = self._read_stat()
+        if current_stat == self._stat:
+            return
+        previous_stat, self._stat = self._stat, current_stat
+        if not current_stat:
+            # Deleted, or mid-way through a delete-then-create save: keep the current snapshot
+            logger.info("%s is missing, keeping the current config until it is back", self.env_path)
+            return
+
+        # Editors that save by replacing the file leave the watch on the old inode
+        if not previous_stat or previous_stat[0] != current_stat[0]:
+            self.watcher.removePath(self.env_path)
+            self.watcher.addPath(self.env_path)
+        self.reload()
+
+    def reload(self):
+        """Load a new snapshot and hand it to the listeners if anything changed"""
+        if not os.path.exists(self.env_path):
+            # Without the file only the environment would remain, dropping its credentials
+            logger.info("%s is missing, keeping the current config", self.env_path)
+            return
+
+        try:
+            config = Config.load(self.env_path)
+        except (OSError, ValueError) as e:
+            logger.error("Ignoring invalid config in %s: %s", self.env_path, str(e))
+            return
+
+        if config == self.config:
+            return
+        self.config = config
+        logger.info("Config reloaded from %s", self.env_path)
+        for listener in self.listeners:
+            try:
+                listener(config)
+            except Exception as e:
+                logger.error("Error applying reloaded config: %s", str(e))
+
+def parse_retry_after(value, default=1.0):
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP-date form)"""
+    if not value:
+        return default
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=UTC)
+        return max((retry_at - datetime.now(UTC)).total_seconds(), 0.0)
+    except (TypeError, ValueError):
+        logger.warning("Could not parse Retry-After header: %s", value)
+        return default
+
 class ZoomAPI:
-    def __init__(self):
-        load_dotenv()
-        self.account_id = os.getenv('ZOOM_ACCOUNT_ID')
-        self.client_id = os.getenv('ZOOM_CLIENT_ID')
-        self.client_secret = os.getenv('ZOOM_CLIENT_SECRET')
+    def __init__(self, config=None, pool_size=10, recorder=None):
+        config = config or Config.load()
+        self.account_id = config.account_id
+        self.client_id = config.client_id
+        self.client_secret = config.client_secret
         self.base_url = "https://api.zoom.us/v2"
         self.token_url = "https://zoom.us/oauth/token"
         self.access_token = None
         self.token_expiry = None
+        # Monotonic time until which the API asked us to back off (HTTP 429)
+        self.rate_limited_until = 0.0
+        # Last meeting list per (user_id, type): (etag, fingerprint, data)
+        self._meetings_cache = {}
+        self._token_lock = threading.Lock()
+        # One connection pool shared by every request, including fleet workers
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        # Optional capture of all API traffic for later replay
+        self.recorder = recorder
         logger.info("ZoomAPI initialized with account_id: %s", self.account_id)
 
+    def apply_config(self, config):
+        """Switch to reloaded credentials, dropping the cached token if they changed"""
+        credentials = (config.account_id, config.client_id, config.client_secret)
+        if credentials == (self.account_id, self.client_id, self.client_secret):
+            return
+
+        with self._token_lock:
+            # Expire before clearing so lock-free readers never compare against None
+            self.token_expiry = datetime.min.replace(tzinfo=UTC)
+            self.access_token = None
+            self.account_id, self.client_id, self.client_secret = credentials
+        logger.info("Zoom credentials changed, access token will be renewed for account_id: %s",
+                    self.account_id)
+
+    def request(self, method, url, **kwargs):
+        """Send a request through the shared session, capturing it when tracing"""
+        if not self.recorder:
+            return self.session.request(method, url, **kwargs)
+
+        started = time.monotonic()
+        response = self.session.request(method, url, **kwargs)
+        key = trace_key(method, url, kwargs.get('params'), self.base_url, self.token_url)
+        self.recorder.record(key, response, time.monotonic() - started)
+        return response
+
     def get_access_token(self):
         """Get access token using Server-to-Server OAuth"""
         if self.access_token and datetime.now(UTC) < self.token_expiry:
             return self.access_token
 
+        with self._token_lock:
+            # Another thread may have refreshed the token while we waited
+            if self.access_token and datetime.now(UTC) < self.token_expiry:
+                return self.access_token
+            return self._request_access_token()
+
+    def _request_access_token(self):
+        """Request a new access token from the OAuth endpoint"""
         logger.info("Requesting new access token")
         try:
             # Base64 encode the client_id:client_secret
@@ -57,7 +290,8 @@ class ZoomAPI:
                 "account_id": self.account_id
             }
 
-            response = requests.post(
+            response = self.request(
+                "POST",
                 self.token_url,
                 headers=headers,
                 data=data
@@ -65,9 +299,10 @@ class ZoomAPI:
 
             if response.status_code == 200:
                 token_data = response.json()
-                self.access_token = token_data['access_token']
                 # Set expiry to 1 hour from now (standard OAuth token lifetime)
                 self.token_expiry = datetime.now(UTC) + timedelta(seconds=token_data.get('expires_in', 3600))
+                # Publish the token last so lock-free readers never see it without an expiry
+                self.access_token = token_data['access_token']
                 logger.info("Successfully obtained new access token")
                 return self.access_token
             else:
@@ -78,9 +313,21 @@ class ZoomAPI:
             logger.error("Error getting access token: %s", str(e))
             return None
 
-    def get_meetings(self):
-        """Get list of meetings for the account"""
-        logger.info("Fetching meetings from Zoom API")
+    def _check_rate_limit(self, response):
+        """Remember how long to back off when the API returns HTTP 429"""
+        if response.status_code == 429:
+            retry_after = parse_retry_after(response.headers.get('Retry-After'))
+            self.rate_limited_until = time.monotonic() + retry_after
+            logger.warning("Rate limited by Zoom API, backing off for %s seconds", retry_after)
+
+    def get_meetings(self, user_id='me', meeting_type=None):
+        """Get list of meetings for a user (defaults to the app's own user)
+
+        Unchanged lists are served from cache: via If-None-Match when the API
+        returns an ETag, otherwise by comparing a hash of the response body
+        before parsing it.
+        """
+        logger.info("Fetching meetings from Zoom API for user: %s", user_id)
         access_token = self.get_access_token()
         if not access_token:
             logger.error("Failed to get valid access token")
@@ -90,11 +337,21 @@ class ZoomAPI:
             "Authorization": f"Bearer {access_token}",
             "Content-Type": "application/json"
         }
+        cache_key = (user_id, meeting_type)
+        cached = self._meetings_cache.get(cache_key)
+        if cached and cached[0]:
+            headers["If-None-Match"] = cached[0]
         try:
-            response = requests.get(
-                f"{self.base_url}/users/me/meetings",
-                headers=headers
+            response = self.request(
+                "GET",
+                f"{self.base_url}/users/{user_id}/meetings",
+                headers=headers,
+                params={"type": meeting_type} if meeting_type else None
             )
+            self._check_rate_limit(response)
+
+            if response.status_code == 304 and cached:
+                return cached[2]
 
             if response.status_code == 401:
                 error_msg = response.json().get('message', 'Unknown error')
@@ -103,11 +360,52 @@ class ZoomAPI:
 
             if response.status_code != 200:
                 logger.error("API Error: %s", response.text)
-            return response.json()
+                return response.json()
+
+            fingerprint = hashlib.sha256(response.content).hexdigest()
+            if cached and cached[1] == fingerprint:
+                return cached[2]
+
+            data = response.json()
+            self._meetings_cache[cache_key] = (response.headers.get('ETag'), fingerprint, data)
+            return data
         except Exception as e:
             logger.error("Error fetching meetings: %s", str(e))
             return {}
 
+    def meetings_fingerprint(self, user_id='me', meeting_type=None):
+        """Fingerprint of the last meeting list returned by get_meetings"""
+        cached = self._meetings_cache.get((user_id, meeting_type))
+        return cached[1] if cached else None
+
+    def get_live_meetings(self, user_id):
+        """Get the meetings a user is currently hosting, or None on failure"""
+        access_token = self.get_access_token()
+        if not access_token:
+            logger.error("Failed to get valid access token")
+            return None
+
+        headers = {
+            "Authorization": f"Bearer {access_token}",
+            "Content-Type": "application/json"
+        }
+        try:
+            response = self.request(
+                "GET",
+                f"{self.base_url}/users/{user_id}/meetings",
+                headers=headers,
+                params={"type": "live", "page_size": 30}
+            )
+            self._check_rate_limit(response)
+
+            if response.status_code != 200:
+                logger.error("Failed to get live meetings for user %s: %s", user_id, response.text)
+                return None
+            return response.json().get('meetings', [])
+        except Exception as e:
+            logger.error("Error fetching live meetings for user %s: %s", user_id, str(e))
+            return None
+
     def start_recording(self, meeting_id):
         """Start recording for a specific meeting"""
         logger.info("Attempting to start recording for meeting: %s", meeting_id)
@@ -122,7 +420,8 @@ class ZoomAPI:
         }
         try:
             # First, enable recording settings
-            settings_response = requests.patch(
+            settings_response = self.request(
+                "PATCH",
                 f"{self.base_url}/meetings/{meeting_id}/recordings/settings",
                 headers=headers,
                 json={"recording": {"local_recording": True}}
@@ -133,7 +432,8 @@ class ZoomAPI:
                 return False
 
             # Then, start the recording
-            response = requests.put(
+            response = self.request(
+                "PUT",
                 f"{self.base_url}/meetings/{meeting_id}/recordings/status",
                 headers=headers,
                 json={"action": "start"}
@@ -161,7 +461,8 @@ class ZoomAPI:
             "Content-Type": "application/json"
         }
         try:
-            response = requests.get(
+            response = self.request(
+                "GET",
                 f"{self.base_url}/meetings/{meeting_id}",
                 headers=headers
             )
@@ -176,10 +477,498 @@ class ZoomAPI:
             logger.error("Error getting meeting status: %s", str(e))
             return None
 
+# Trace format version; 2 lists the window's meetings with type=live
+TRACE_VERSION = 2
+
+# Keys whose values are replaced before a response is written to a trace
+REDACTED_KEYS = {'access_token', 'refresh_token', 'password', 'h323_password',
+                 'pstn_password', 'encrypted_password', 'start_url', 'join_url'}
+
+def trace_key(method, url, params, base_url, token_url):
+    """Build the lookup key for a request, e.g. 'GET /users/me/meetings?type=live'"""
+    if url == token_url:
+        path = "/oauth/token"
+    elif url.startswith(base_url):
+        path = url[len(base_url):]
+    else:
+        path = urlsplit(url).path
+    if params:
+        path += "?" + "&".join(f"{key}={params[key]}" for key in sorted(params))
+    return f"{method} {path}"
+
+def redact(value):
+    """Return a copy of a JSON payload with secrets replaced"""
+    if isinstance(value, dict):
+        return {key: "REDACTED" if key in REDACTED_KEYS else redact(item)
+                for key, item in value.items()}
+    if isinstance(value, list):
+        return [redact(item) for item in value]
+    return value
+
+class TraceRecorder:
+    """Write Zoom API request/response pairs to a gzipped JSON-lines trace
+
+    Only the request key, status, duration and redacted response body are
+    stored. Request headers and bodies (credentials, tokens) are never written.
+    The user's answers to the prompt are recorded too, so a replay can repeat them.
+    An existing trace is never overwritten; a timestamped name is used instead.
+    """
+    def __init__(self, path):
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        if os.path.exists(path):
+            directory, filename = os.path.split(path)
+            name, dot, extension = filename.partition('.')
+            stamp = datetime.now().strftime('%Y%m%d-%H%M%S')
+            path = os.path.join(directory, f"{name}-{stamp}{dot}{extension}")
+            logger.info("Trace file already exists, recording to %s instead", path)
+        self.path = path
+        self.started = time.monotonic()
+        self.count = 0
+        self._lock = threading.Lock()
+        # 'x' so a trace is never truncated, even if the new name is taken meanwhile
+        self._file = gzip.open(path, 'xt', encoding='utf-8')
+        self._write({"version": TRACE_VERSION, "start": datetime.now(UTC).isoformat()})
+        atexit.register(self.close)
+        logger.info("Recording Zoom API traffic to %s", path)
+
+    def record(self, key, response, duration):
+        """Append one request/response pair to the trace"""
+        try:
+            try:
+                body = {"json": redact(response.json())}
+            except ValueError:
+                body = {"text": response.text}
+            self._append({
+                "key": key,
+                "status": response.status_code,
+                "duration": round(duration, 4),
+                **body
+            })
+        except Exception as e:
+            logger.error("Error recording trace entry: %s", str(e))
+
+    def record_action(self, action, meeting_id, **details):
+        """Append a prompt action (yes, no or snooze) taken by the user"""
+        try:
+            self._append({"action": action, "meeting_id": meeting_id, **details})
+        except Exception as e:
+            logger.error("Error recording trace action: %s", str(e))
+
+    def _append(self, entry):
+        with self._lock:
+            self._write({"t": round(time.monotonic() - self.started, 3), **entry})
+            self.count += 1
+            if self.count % 100 == 0:
+                self._file.flush()
+
+    def _write(self, entry):
+        self._file.write(json.dumps(entry, separators=(',', ':')) + "\n")
+
+    def close(self):
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+                logger.info("Closed trace with %s entries", self.count)
+
+def open_trace_recorder(path):
+    """Start recording to `path`, or return None (and keep running) if it cannot be opened"""
+    if not path:
+        return None
+    try:
+        return TraceRecorder(path)
+    except OSError as e:
+        logger.error("Could not open trace file %s, continuing without recording: %s", path, str(e))
+        return None
+
+class ReplayResponse:
+    """Minimal stand-in for requests.Response built from a trace entry"""
+    def __init__(self, entry):
+        self.status_code = entry["status"]
+        self.headers = {}
+        self._json = entry.get("json")
+        self.text = entry["text"] if "text" in entry else json.dumps(self._json)
+        self.content = self.text.encode()
+
+    def json(self):
+        if self._json is None:
+            raise ValueError("Trace entry has no JSON body")
+        return self._json
+
+class TraceReplayer:
+    """Feed a recorded trace back through the prompt engine without network
+
+    Stands in for ZoomAPI.session. Each request is answered with the latest
+    response recorded for the same key at or before the current virtual time,
+    so the replay does not depend on issuing exactly the recorded calls.
+    Recorded prompt actions are repeated at their recorded time.
+    """
+    def __init__(self, path, base_url, token_url):
+        self.base_url = base_url
+        self.token_url = token_url
+        self.responses = {}
+        self.actions = []
+        self.offset = 0.0
+        self.duration = 0.0
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            header = json.loads(f.readline())
+            version = header.get("version", 1)
+            if version > TRACE_VERSION:
+                raise ValueError(f"Trace {path} has version {version}, newer than supported {TRACE_VERSION}")
+            if version < 2:
+                logger.warning("Trace %s uses version %s; serving its meeting lists as type=live lists",
+                               path, version)
+            self.started_at = datetime.fromisoformat(header["start"])
+            for line in f:
+                entry = json.loads(line)
+                if version < 2 and "key" in entry:
+                    entry["key"] = self._upgrade_v1_key(entry["key"])
+                if "action" in entry:
+                    self.actions.append(entry)
+                else:
+                    times, entries = self.responses.setdefault(entry["key"], ([], []))
+                    times.append(entry["t"])
+                    entries.append(entry)
+                self.duration = max(self.duration, entry["t"])
+        self.actions.sort(key=lambda entry: entry["t"])
+        logger.info("Loaded trace %s covering %.0f seconds, %s endpoints and %s prompt actions",
+                    path, self.duration, len(self.responses), len(self.actions))
+
+    @staticmethod
+    def _upgrade_v1_key(key):
+        """Map a version 1 meeting list key to the type=live list the window now requests
+
+        Version 1 traces hold the default (scheduled) list. The window still checks
+        each meeting's status before prompting, so serving it as the live list
+        replays the same behaviour.
+        """
+        method, _, path = key.partition(" ")
+        if method == "GET" and path.startswith("/users/") and path.endswith("/meetings"):
+            return f"{key}?type=live"
+        return key
+
+    def now(self):
+        """Virtual wall-clock time of the replay"""
+        return self.started_at + timedelta(seconds=self.offset)
+
+    def request(self, method, url, params=None, **kwargs):
+        key = trace_key(method, url, params, self.base_url, self.token_url)
+        if key not in self.responses:
+            return ReplayResponse({"status": 404, "json": {"message": f"{key} not in trace"}})
+        times, entries = self.responses[key]
+        index = max(bisect.bisect_right(times, self.offset) - 1, 0)
+        return ReplayResponse(entries[index])
+
+    def run(self, window, interval, speed=1.0):
+        """Tick the window every `interval` virtual seconds, `speed` times faster than real time
+
+        A speed of 0 replays as fast as possible.
+        """
+        window.check_timer.stop()
+        window.zoom_api.session = self
+        window.zoom_api.recorder = None
+        window._now = self.now
+        window._is_zoom_running = lambda: True
+        # Never send keystrokes or desktop notifications during a replay
+        window._execute_recording_keystrokes = lambda: None
+        window.show_notification = lambda title, message: logger.info(
+            "Replay notification: %s - %s", title, message)
+
+        tick_times = []
+        prompts = 0
+        pending_actions = deque(self.actions)
+        wall_started = time.monotonic()
+        self.offset = 0.0
+        while self.offset <= self.duration:
+            # Repeat the user's answers that happened before this tick
+            while pending_actions and pending_actions[0]["t"] <= self.offset:
+                self._replay_action(window, pending_actions.popleft())
+
+            was_visible = window.isVisible()
+            tick_started = time.perf_counter()
+            window.check_zoom_status()
+            tick_times.append(time.perf_counter() - tick_started)
+            if window.isVisible() and not was_visible:
+                prompts += 1
+            QCoreApplication.processEvents()
+
+            self.offset += interval
+            if speed:
+                delay = wall_started + self.offset / speed - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+
+        while pending_actions:
+            self._replay_action(window, pending_actions.popleft())
+
+        tick_times.sort()
+        logger.info("Replay finished: %s ticks, %s prompts shown in %.1f s; tick p50 %.2f ms, p95 %.2f ms, max %.2f ms",
+                    len(tick_times), prompts, time.monotonic() - wall_started,
+                    tick_times[len(tick_times) // 2] * 1000,
+                    tick_times[int(len(tick_times) * 0.95)] * 1000,
+                    tick_times[-1] * 1000)
+        return tick_times
+
+    def _replay_action(self, window, entry):
+        """Answer the prompt the way the user did when the trace was recorded"""
+        meeting_id = entry["meeting_id"]
+        if not window.isVisible() or window.current_meeting_id != meeting_id:
+            logger.warning("Replay: '%s' was recorded for meeting %s but the prompt shows %s",
+                           entry["action"], meeting_id,
+                           window.current_meeting_id if window.isVisible() else "nothing")
+        window.current_meeting_id = meeting_id
+
+        if entry["action"] == "yes":
+            window.start_recording()
+        elif entry["action"] == "no":
+            window.decline()
+        elif entry["action"] == "snooze":
+            if entry.get("mode") == "all":
+                window.wait_members_radio.setChecked(True)
+            else:
+                window.minutes_radio.setChecked(True)
+                window.snooze_spinbox.setValue(entry.get("minutes", window.config.default_snooze_time))
+            window.snooze()
+        else:
+            logger.warning("Replay: ignoring unknown action '%s'", entry["action"])
+
+class HostState:
+    """Compact per-host polling state for fleet mode"""
+    __slots__ = ('user_id', 'live_meeting_ids', 'last_polled')
+
+    def __init__(self, user_id):
+        self.user_id = user_id
+        self.live_meeting_ids = frozenset()
+        self.last_polled = 0.0
+
+class ZoomFleetMonitor:
+    """Watch live meetings for many hosts from one process
+
+    All hosts share the ZoomAPI token and connection pool. Hosts are polled
+    round-robin by a small worker pool, throttled by a token bucket so the
+    account stays inside its rate limits. Each tick only dispatches new polls
+    and drains finished ones, so its cost does not grow with the fleet size.
+    """
+    def __init__(self, zoom_api, user_ids, requests_per_second=10, max_workers=8,
+                 tick_interval=1000, notify_url=None):
+        self.zoom_api = zoom_api
+        self.hosts = {user_id: HostState(user_id) for user_id in user_ids}
+        self.poll_order = deque(self.hosts)
+        self.requests_per_second = requests_per_second
+        self.notify_url = notify_url
+
+        self.tokens = float(requests_per_second)
+        self.last_refill = time.monotonic()
+        self.in_flight = set()
+        # Futures append themselves here from worker threads; deque appends are thread-safe
+        self.completed = deque()
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="fleet")
+
+        self.poll_timer = QTimer()
+        self.poll_timer.timeout.connect(self.tick)
+        self.poll_timer.start(tick_interval)
+        logger.info("Fleet mode monitoring %s hosts at %s requests/s (full sweep every %.0f s)",
+                    len(self.hosts), requests_per_second,
+                    len(self.hosts) / requests_per_second)
+
+    def apply_config(self, config):
+        """Apply a reloaded config snapshot: credentials, rate budget and host list"""
+        self.zoom_api.apply_config(config)
+        self.requests_per_second = config.fleet_requests_per_second
+        self.notify_url = config.fleet_notify_url
+        if config.fleet_user_ids and config.fleet_user_ids != tuple(self.hosts):
+            self.hosts = {user_id: self.hosts.get(user_id) or HostState(user_id)
+                          for user_id in config.fleet_user_ids}
+            self.poll_order = deque(self.hosts)
+            logger.info("Fleet mode now monitoring %s hosts", len(self.hosts))
+
+    def tick(self):
+        """Drain finished polls and dispatch as many new ones as the budget allows"""
+        try:
+            while self.completed:
+                self._handle_result(self.completed.popleft())
+
+            now = time.monotonic()
+            # Let the bucket hold at least one token so budgets below 1 request/s still dispatch
+            self.tokens = min(max(1.0, self.requests_per_second),
+                              self.tokens + (now - self.last_refill) * self.requests_per_second)
+            self.last_refill = now
+            if now < self.zoom_api.rate_limited_until:
+                return
+
+            # Round-robin so every host gets the same share of the budget
+            for _ in range(len(self.poll_order)):
+                if self.tokens < 1:
+                    break
+                user_id = self.poll_order[0]
+                self.poll_order.rotate(-1)
+                if user_id in self.in_flight:
+                    continue
+                self.tokens -= 1
+                self.in_flight.add(user_id)
+                future = self.executor.submit(self._poll_host, user_id)
+                future.add_done_callback(self.completed.append)
+        except Exception as e:
+            logger.error("Error in fleet tick: %s", str(e))
+
+    def _poll_host(self, user_id):
+        """Fetch a host's live meetings (runs on a worker thread)
+
+        Always returns the user ID so the host is released from in_flight.
+        """
+        try:
+            return user_id, self.zoom_api.get_live_meetings(user_id)
+        except Exception as e:
+            logger.error("Error polling fleet host %s: %s", user_id, str(e))
+            return user_id, None
+
+    def _handle_result(self, future):
+        """Update host state and notify about newly started meetings"""
+        try:
+            user_id, meetings = future.result()
+        except Exception as e:
+            logger.error("Error polling fleet host: %s", str(e))
+            return
+
+        self.in_flight.discard(user_id)
+        state = self.hosts.get(user_id)
+        # The host may have been removed from the fleet while it was being polled
+        if meetings is None or state is None:
+            return
+
+        state.last_polled = time.monotonic()
+        live_meeting_ids = frozenset(meeting['id'] for meeting in meetings)
+        for meeting in meetings:
+            if meeting['id'] not in state.live_meeting_ids:
+                self._notify_host(user_id, meeting)
+        state.live_meeting_ids = live_meeting_ids
+
+    def _notify_host(self, user_id, meeting):
+        """Tell the host that their meeting has started and may need recording"""
+        logger.info("Host %s started meeting %s (%s)", user_id, meeting['id'], meeting.get('topic', ''))
+        if not self.notify_url:
+            return
+        payload = {
+            "host": user_id,
+            "meeting_id": meeting['id'],
+            "topic": meeting.get('topic', ''),
+            "join_url": meeting.get('join_url', ''),
+            "text": f"Your meeting \"{meeting.get('topic', meeting['id'])}\" has started. Would you like to record it?"
+        }
+        self.executor.submit(self._post_notification, payload)
+
+    def _post_notification(self, payload):
+        """Send a notification to the configured webhook (runs on a worker thread)"""
+        try:
+            # Use the session directly so webhook traffic never ends up in a Zoom API trace
+            response = self.zoom_api.session.request("POST", self.notify_url, json=payload, timeout=10)
+            if response.status_code >= 400:
+                logger.error("Failed to notify host %s: %s", payload['host'], response.text)
+        except Exception as e:
+            logger.error("Error notifying host %s: %s", payload['host'], str(e))
+
+class TickProfiler:
+    """Profile the next N poll ticks on demand (SIGUSR1 or PROFILE_ON_START)
+
+    While idle the timer is connected straight to the tick callback, so there is
+    no profiling overhead until a session is armed. With memory_from_start,
+    tracemalloc runs for the whole process and every dump is also diffed against
+    process start (first dump) or the previous dump, to show long-term growth.
+    """
+    def __init__(self, timer, tick, ticks=10, output_dir='.', memory_from_start=False):
+        self.timer = timer
+        self.tick = tick
+        self.ticks = ticks
+        self.output_dir = output_dir
+        self.remaining_ticks = 0
+        self.profile = None
+        self.start_snapshot = None
+        self.started_tracemalloc = False
+        # Snapshot from process start or the previous dump, kept while tracing stays on
+        self.baseline_snapshot = None
+        if memory_from_start:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+            self.baseline_snapshot = tracemalloc.take_snapshot()
+            logger.info("Tracing memory allocations from process start")
+
+    def install_signal_handler(self):
+        """Arm a profiling session whenever the process receives SIGUSR1"""
+        if not hasattr(signal, 'SIGUSR1'):
+            logger.info("SIGUSR1 not available on this platform, profiling trigger disabled")
+            return
+        signal.signal(signal.SIGUSR1, lambda signum, frame: self.arm())
+        logger.info("Send SIGUSR1 to pid %s to profile the next %s ticks", os.getpid(), self.ticks)
+
+    def arm(self):
+        """Start profiling the next N ticks and take a baseline memory snapshot"""
+        if self.remaining_ticks:
+            logger.info("Profiling already in progress, %s ticks remaining", self.remaining_ticks)
+            return
+
+        logger.info("Profiling the next %s ticks", self.ticks)
+        self.remaining_ticks = self.ticks
+        self.profile = cProfile.Profile()
+        self.started_tracemalloc = not tracemalloc.is_tracing()
+        if self.started_tracemalloc:
+            tracemalloc.start()
+        self.start_snapshot = tracemalloc.take_snapshot()
+
+        # Swap the timer over to the profiled tick
+        self.timer.timeout.disconnect(self.tick)
+        self.timer.timeout.connect(self._profiled_tick)
+
+    def _profiled_tick(self):
+        """Run one tick under cProfile and finish once N ticks are done"""
+        try:
+            self.profile.runcall(self.tick)
+        finally:
+            self.remaining_ticks -= 1
+            if self.remaining_ticks <= 0:
+                self._finish()
+
+    def _finish(self):
+        """Restore the plain tick and write the pstats and tracemalloc dumps"""
+        self.timer.timeout.disconnect(self._profiled_tick)
+        self.timer.timeout.connect(self.tick)
+        self.remaining_ticks = 0
+
+        try:
+            os.makedirs(self.output_dir, exist_ok=True)
+            stamp = datetime.now().strftime('%Y%m%d-%H%M%S')
+            base_path = os.path.join(self.output_dir, f"zoom_prompt-{stamp}")
+
+            stats_path = f"{base_path}.pstats"
+            self.profile.dump_stats(stats_path)
+            summary = io.StringIO()
+            pstats.Stats(self.profile, stream=summary).sort_stats('cumulative').print_stats(15)
+            logger.info("Profile written to %s\n%s", stats_path, summary.getvalue())
+
+            end_snapshot = tracemalloc.take_snapshot()
+            snapshot_path = f"{base_path}.tracemalloc"
+            end_snapshot.dump(snapshot_path)
+            logger.info("Memory snapshot written to %s", snapshot_path)
+            for stat in end_snapshot.compare_to(self.start_snapshot, 'lineno')[:10]:
+                logger.info("Memory growth: %s", stat)
+
+            # Tracing outlives the session, so also report growth since the last baseline
+            if not self.started_tracemalloc:
+                if self.baseline_snapshot:
+                    for stat in end_snapshot.compare_to(self.baseline_snapshot, 'lineno')[:10]:
+                        logger.info("Memory growth since last baseline: %s", stat)
+                self.baseline_snapshot = end_snapshot
+        except Exception as e:
+            logger.error("Error writing profiling output: %s", str(e))
+        finally:
+            if self.started_tracemalloc:
+                tracemalloc.stop()
+            self.profile = None
+            self.start_snapshot = None
+
 class ZoomRecordingPrompt(QMainWindow):
-    def __init__(self):
+    def __init__(self, config=None, recorder=None):
         super().__init__()
         logger.info("Initializing ZoomRecordingPrompt")
+        self.config = config or Config.load()
         self.setFixedSize(400, 240)
         # Set window flags to keep on top
         self.setWindowFlags(self.windowFlags() | Qt.WindowType.WindowStaysOnTopHint)
@@ -193,10 +982,10 @@ class ZoomRecordingPrompt(QMainWindow):
         """)
 
         # Initialize Zoom API
-        self.zoom_api = ZoomAPI()
+        self.zoom_api = ZoomAPI(self.config, recorder=recorder)
 
-        # Store recently prompted meetings
-        self.prompted_meetings = deque(maxlen=5)
+        # Store prompted meetings (pruned to the live meetings every check)
+        self.prompted_meetings = set()
         # Store snoozed meetings and their expiry times
         self.snoozed_meetings = {}
 
@@ -213,6 +1002,7 @@ class ZoomRecordingPrompt(QMainWindow):
         # Title label
         self.title_label = QLabel("Would you like to record this meeting?")
         self.title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.title_label.setWordWrap(True)
         self.title_label.setStyleSheet("""
             font-family: -apple-system, 'SF Pro Display', 'SF Pro Text', system-ui;
             font-size: 14px;
@@ -278,7 +1068,7 @@ class ZoomRecordingPrompt(QMainWindow):
         self.no_button.setStyleSheet(secondary_button)
 
         self.yes_button.clicked.connect(self.start_recording)
-        self.no_button.clicked.connect(self.hide)
+        self.no_button.clicked.connect(self.decline)
 
         # No stretching - buttons will take up full width
         button_layout.addWidget(self.yes_button)
@@ -312,7 +1102,7 @@ class ZoomRecordingPrompt(QMainWindow):
 
         self.snooze_spinbox = QSpinBox()
         self.snooze_spinbox.setRange(1, 60)
-        self.snooze_spinbox.setValue(int(os.getenv('DEFAULT_SNOOZE_TIME', 2)))
+        self.snooze_spinbox.setValue(self.config.default_snooze_time)
         self.snooze_spinbox.setSuffix("")
         self.snooze_spinbox.setStyleSheet("""
             QSpinBox {
@@ -395,201 +1185,358 @@ class ZoomRecordingPrompt(QMainWindow):
         # Timer for checking Zoom status
         self.check_timer = QTimer()
         self.check_timer.timeout.connect(self.check_zoom_status)
-        check_interval = int(os.getenv('CHECK_INTERVAL', 5)) * 1000  # Convert to milliseconds
+        check_interval = self.config.check_interval * 1000  # Convert to milliseconds
         self.check_timer.start(check_interval)
         logger.info("Check timer started with interval: %s ms", check_interval)
 
-        # Store current meeting ID
+        # On-demand profiling of the poll ticks
+        self.profiler = TickProfiler(
+            self.check_timer,
+            self.check_zoom_status,
+            ticks=self.config.profile_ticks,
+            output_dir=self.config.profile_dir,
+            memory_from_start=self.config.profile_memory_from_start
+        )
+        self.profiler.install_signal_handler()
+        if self.config.profile_on_start:
+            self.profiler.arm()
+
+        # Meeting the visible prompt is bound to
         self.current_meeting_id = None
+        # Live meetings from the last check, keyed by meeting ID
+        self.active_meetings = {}
+        # Meetings waiting for a prompt, ordered by scheduled start time
+        self.pending_prompts = []
+        self.queued_meetings = set()
+        # Status lookups allowed per check, so a burst of new meetings is spread over several checks
+        self.max_status_checks = 10
+        # Where the next wait-for-all participant check starts when there are more than max_status_checks
+        self.wait_for_all_cursor = 0
+        # Fingerprints of the last reconciled meeting list and of each live meeting
+        self.meetings_fingerprint = None
+        self.meeting_fingerprints = {}
 
         # Start with window hidden
         self.hide()
 
+    def apply_config(self, config):
+        """Apply a reloaded config snapshot without restarting"""
+        old_config, self.config = self.config, config
+
+        if config.check_interval != old_config.check_interval:
+            self.check_timer.setInterval(config.check_interval * 1000)
+            logger.info("Check timer interval changed to: %s ms", config.check_interval * 1000)
+        if config.default_snooze_time != old_config.default_snooze_time:
+            self.snooze_spinbox.setValue(config.default_snooze_time)
+        self.profiler.ticks = config.profile_ticks
+        self.profiler.output_dir = config.profile_dir
+        self.zoom_api.apply_config(config)
+
+    def _now(self):
+        """Current time; replaced by the virtual clock during trace replay"""
+        return datetime.now(UTC)
+
+    def _is_zoom_running(self):
+        """Check if the Zoom process is running"""
+        # Different process names for different platforms
+        zoom_process_names = ['zoom.us', 'Zoom', 'Zoom.exe', 'CptHost.exe']
+
+        for proc in psutil.process_iter(['name']):
+            if proc.info['name'] in zoom_process_names:
+                return True
+
+        # Additional check for macOS
+        if sys.platform == 'darwin':
+            try:
+                import subprocess
+                result = subprocess.run(
+                    ["pgrep", "-f", "zoom.us"],
+                    capture_output=True,
+                    text=True,
+                    check=False
+                )
+                if result.returncode == 0 and result.stdout.strip():
+                    return True
+            except Exception as e:
+                logger.error(f"Error checking for Zoom with pgrep: {str(e)}")
+
+        return False
+
     def check_zoom_status(self):
         """Check if Zoom is running and user is host"""
         try:
-            # Check if Zoom process is running
-            zoom_running = False
-
-            # Different process names for different platforms
-            zoom_process_names = ['zoom.us', 'Zoom', 'Zoom.exe', 'CptHost.exe']
+            if not self._is_zoom_running():
+                if self.isVisible():
+                    self.hide()
+                return
 
-            for proc in psutil.process_iter(['name']):
-                if proc.info['name'] in zoom_process_names:
-                    zoom_running = True
-                    break
+            # Get current live meetings
+            meetings = self.zoom_api.get_meetings(meeting_type='live')
 
-            # Additional check for macOS
-            if not zoom_running and sys.platform == 'darwin':
-                try:
-                    import subprocess
-                    result = subprocess.run(
-                        ["pgrep", "-f", "zoom.us"],
-                        capture_output=True,
-                        text=True,
-                        check=False
-                    )
-                    if result.returncode == 0 and result.stdout.strip():
-                        zoom_running = True
-                except Exception as e:
-                    logger.error(f"Error checking for Zoom with pgrep: {str(e)}")
+            if 'meetings' in meetings:
+                # Only reconcile when the meeting list has changed since the last check
+                changed_meetings = set()
+                fingerprint = self.zoom_api.meetings_fingerprint(meeting_type='live')
+                if fingerprint is None or fingerprint != self.meetings_fingerprint:
+                    self.meetings_fingerprint = fingerprint
+                    changed_meetings = self._reconcile_meetings(meetings['meetings'])
+
+                # Clean up expired snoozed meetings
+                current_time = self._now()
+                expired_snoozes = [meeting_id for meeting_id, expiry_time in self.snoozed_meetings.items()
+                                 if current_time > expiry_time and expiry_time != self.datetime_max_aware]
+
+                # Check "wait for all members" snoozes only for meetings in this check's live list
+                expired_snoozes.extend(self._check_wait_for_all_snoozes())
+
+                # A meeting can be listed twice when its wait-for-all snooze ends
+                for meeting_id in expired_snoozes:
+                    self.snoozed_meetings.pop(meeting_id, None)
+
+                # Queue a prompt for changed meetings and those whose snooze just ended
+                for meeting_id in changed_meetings.union(expired_snoozes):
+                    if (meeting_id in self.active_meetings and
+                        meeting_id not in self.prompted_meetings and
+                        meeting_id not in self.snoozed_meetings and
+                        meeting_id not in self.queued_meetings):
+                        meeting = self.active_meetings[meeting_id]
+                        heapq.heappush(self.pending_prompts, (meeting.get('start_time') or '', meeting_id))
+                        self.queued_meetings.add(meeting_id)
+
+                # Drop the prompt if its meeting has ended
+                if self.isVisible() and self.current_meeting_id not in self.active_meetings:
+                    self.hide()
 
-            if not zoom_running:
+                self._show_next_prompt()
+            else:
                 if self.isVisible():
                     self.hide()
-                return
 
-            # Get current meetings
-            meetings = self.zoom_api.get_meetings()
-
-            # Clean up expired snoozed meetings
-            current_time = datetime.now(UTC)
-            expired_snoozes = [meeting_id for meeting_id, expiry_time in self.snoozed_meetings.items()
-                             if current_time > expiry_time and expiry_time != self.datetime_max_aware]
-
-            # Check for "wait for all members" snoozed meetings
-            for meeting_id, expiry_time in list(self.snoozed_meetings.items()):
-                if expiry_time == self.datetime_max_aware:
-                    # This is a "wait for all members" snooze
-                    meeting_status = self.zoom_api.get_meeting_status(meeting_id)
-
-                    # Check if we can get participant data
-                    if meeting_status and meeting_status.get('status') == 'started':
-                        try:
-                            # Get participants for this meeting
-                            headers = {
-                                "Authorization": f"Bearer {self.zoom_api.get_access_token()}",
-                                "Content-Type": "application/json"
-                            }
-
-                            response = requests.get(
-                                f"{self.zoom_api.base_url}/meetings/{meeting_id}/metrics/participants",
-                                headers=headers
-                            )
-
-                            if response.status_code == 200:
-                                participants_data = response.json()
-                                participants_joined = set()
-
-                                # Extract participant emails
-                                if 'participants' in participants_data:
-                                    for participant in participants_data['participants']:
-                                        if participant.get('email'):
-                                            participants_joined.add(participant['email'])
-
-                                # Get expected participants
-                                expected_response = requests.get(
-                                    f"{self.zoom_api.base_url}/meetings/{meeting_id}",
-                                    headers=headers
-                                )
-
-                                if expected_response.status_code == 200:
-                                    meeting_details = expected_response.json()
-                                    required_participants = set()
-
-                                    # Extract required participants (non-optional)
-                                    if 'settings' in meeting_details and 'meeting_invitees' in meeting_details['settings']:
-                                        for invitee in meeting_details['settings']['meeting_invitees']:
-                                            if not invitee.get('optional', False) and invitee.get('email'):
-                                                required_participants.add(invitee['email'])
-
-                                    # Log the expected and current participants
-                                    logger.info(f"Meeting {meeting_id}: Required participants: {sorted(list(required_participants))}")
-                                    logger.info(f"Meeting {meeting_id}: Current participants: {sorted(list(participants_joined))}")
-
-                                    # Determine who is missing
-                                    missing_participants = required_participants - participants_joined
-                                    if missing_participants:
-                                        logger.info(f"Meeting {meeting_id}: Still waiting for: {sorted(list(missing_participants))}")
-                                    else:
-                                        # No one is missing or no required participants found
-                                        logger.info(f"Meeting {meeting_id}: No missing participants, removing from snoozed to re-prompt")
-                                        expired_snoozes.append(meeting_id)
-                                        # Remove from prompted meetings as well to ensure it's re-prompted
-                                        if meeting_id in self.prompted_meetings:
-                                            self.prompted_meetings.remove(meeting_id)
-
-                                    # If all required participants have joined, remove from snoozed
-                                    if required_participants and required_participants.issubset(participants_joined):
-                                        logger.info("All required participants joined meeting %s, removing from snoozed", meeting_id)
-                                        expired_snoozes.append(meeting_id)
-                                else:
-                                    # If we can't get expected participants, remove from snoozed to re-prompt
-                                    logger.info(f"Meeting {meeting_id}: Could not get expected participants, removing from snoozed to re-prompt")
-                                    expired_snoozes.append(meeting_id)
-                                    if meeting_id in self.prompted_meetings:
-                                        self.prompted_meetings.remove(meeting_id)
+        except Exception as e:
+            logger.error("Error in check_zoom_status: %s", str(e))
+            if self.isVisible():
+                self.hide()
+
+    def _check_wait_for_all_snoozes(self):
+        """Check participants of meetings snoozed until all required members join
+
+        Only meetings still in the live list are checked, at most
+        max_status_checks per call, rotating through them when there are more.
+        Returns the IDs whose snooze should end.
+        """
+        expired_snoozes = []
+        waiting = [meeting_id for meeting_id, expiry_time in self.snoozed_meetings.items()
+                   if expiry_time == self.datetime_max_aware and meeting_id in self.active_meetings]
+        if len(waiting) > self.max_status_checks:
+            start = self.wait_for_all_cursor % len(waiting)
+            waiting = (waiting + waiting)[start:start + self.max_status_checks]
+            self.wait_for_all_cursor = start + self.max_status_checks
+
+        for meeting_id in waiting:
+            meeting_status = self.zoom_api.get_meeting_status(meeting_id)
+
+            # Check if we can get participant data
+            if meeting_status and meeting_status.get('status') == 'started':
+                try:
+                    # Get participants for this meeting
+                    headers = {
+                        "Authorization": f"Bearer {self.zoom_api.get_access_token()}",
+                        "Content-Type": "application/json"
+                    }
+
+                    response = self.zoom_api.request(
+                        "GET",
+                        f"{self.zoom_api.base_url}/meetings/{meeting_id}/metrics/participants",
+                        headers=headers
+                    )
+
+                    if response.status_code == 200:
+                        participants_data = response.json()
+                        participants_joined = set()
+
+                        # Extract participant emails
+                        if 'participants' in participants_data:
+                            for participant in participants_data['participants']:
+                                if participant.get('email'):
+                                    participants_joined.add(participant['email'])
+
+                        # Get expected participants
+                        expected_response = self.zoom_api.request(
+                            "GET",
+                            f"{self.zoom_api.base_url}/meetings/{meeting_id}",
+                            headers=headers
+                        )
+
+                        if expected_response.status_code == 200:
+                            meeting_details = expected_response.json()
+                            required_participants = set()
+
+                            # Extract required participants (non-optional)
+                            if 'settings' in meeting_details and 'meeting_invitees' in meeting_details['settings']:
+                                for invitee in meeting_details['settings']['meeting_invitees']:
+                                    if not invitee.get('optional', False) and invitee.get('email'):
+                                        required_participants.add(invitee['email'])
+
+                            # Log the expected and current participants
+                            logger.info(f"Meeting {meeting_id}: Required participants: {sorted(list(required_participants))}")
+                            logger.info(f"Meeting {meeting_id}: Current participants: {sorted(list(participants_joined))}")
+
+                            # Determine who is missing
+                            missing_participants = required_participants - participants_joined
+                            if missing_participants:
+                                logger.info(f"Meeting {meeting_id}: Still waiting for: {sorted(list(missing_participants))}")
                             else:
-                                # If we can't get current participants, remove from snoozed to re-prompt
-                                logger.info(f"Meeting {meeting_id}: Could not get current participants, removing from snoozed to re-prompt")
+                                # No one is missing or no required participants found
+                                logger.info(f"Meeting {meeting_id}: No missing participants, removing from snoozed to re-prompt")
                                 expired_snoozes.append(meeting_id)
+                                # Remove from prompted meetings as well to ensure it's re-prompted
                                 if meeting_id in self.prompted_meetings:
                                     self.prompted_meetings.remove(meeting_id)
-                        except Exception as e:
-                            logger.error("Error checking participants for meeting %s: %s", meeting_id, str(e))
-                            # If there's an error, remove from snoozed to re-prompt
-                            logger.info(f"Meeting {meeting_id}: Error checking participants, removing from snoozed to re-prompt")
+
+                            # If all required participants have joined, remove from snoozed
+                            if required_participants and required_participants.issubset(participants_joined):
+                                logger.info("All required participants joined meeting %s, removing from snoozed", meeting_id)
+                                expired_snoozes.append(meeting_id)
+                        else:
+                            # If we can't get expected participants, remove from snoozed to re-prompt
+                            logger.info(f"Meeting {meeting_id}: Could not get expected participants, removing from snoozed to re-prompt")
                             expired_snoozes.append(meeting_id)
                             if meeting_id in self.prompted_meetings:
                                 self.prompted_meetings.remove(meeting_id)
+                    else:
+                        # If we can't get current participants, remove from snoozed to re-prompt
+                        logger.info(f"Meeting {meeting_id}: Could not get current participants, removing from snoozed to re-prompt")
+                        expired_snoozes.append(meeting_id)
+                        if meeting_id in self.prompted_meetings:
+                            self.prompted_meetings.remove(meeting_id)
+                except Exception as e:
+                    logger.error("Error checking participants for meeting %s: %s", meeting_id, str(e))
+                    # If there's an error, remove from snoozed to re-prompt
+                    logger.info(f"Meeting {meeting_id}: Error checking participants, removing from snoozed to re-prompt")
+                    expired_snoozes.append(meeting_id)
+                    if meeting_id in self.prompted_meetings:
+                        self.prompted_meetings.remove(meeting_id)
 
-            for meeting_id in expired_snoozes:
-                del self.snoozed_meetings[meeting_id]
+        return expired_snoozes
 
-            if 'meetings' in meetings:
-                active_meeting = False
-                for meeting in meetings['meetings']:
-                    meeting_id = meeting['id']
-                    meeting_status = self.zoom_api.get_meeting_status(meeting_id)
-
-                    if meeting_status and meeting_status.get('status') == 'started':
-                        self.current_meeting_id = meeting_id
-                        active_meeting = True
-
-                        # Check if meeting has been prompted or is snoozed
-                        if (meeting_id not in self.prompted_meetings and
-                            meeting_id not in self.snoozed_meetings):
-                            if not self.isVisible():
-                                # Center the window on the screen
-                                screen = QApplication.primaryScreen().geometry()
-                                self.move(
-                                    screen.center().x() - self.width() // 2,
-                                    screen.center().y() - self.height() // 2
-                                )
-                                self.show()
-                                # Add to prompted meetings only when showing the window
-                                self.prompted_meetings.append(meeting_id)
-                        break
-
-                if not active_meeting and self.isVisible():
-                    self.hide()
+    def _reconcile_meetings(self, meetings):
+        """Diff the live meeting list against the last one and check only what changed
+
+        Returns the IDs of the added or changed meetings that were checked. At
+        most max_status_checks are checked per call, earliest scheduled first;
+        the rest are left for the next check.
+        """
+        fingerprints = {
+            meeting['id']: hashlib.sha256(json.dumps(meeting, sort_keys=True).encode()).hexdigest()
+            for meeting in meetings
+        }
+        meetings_by_id = {meeting['id']: meeting for meeting in meetings}
+
+        removed = self.meeting_fingerprints.keys() - fingerprints.keys()
+        changed = {meeting_id for meeting_id, fingerprint in fingerprints.items()
+                   if self.meeting_fingerprints.get(meeting_id) != fingerprint}
+        if removed or changed:
+            logger.info("Meeting list changed: %s added or changed, %s removed", len(changed), len(removed))
+
+        for meeting_id in removed:
+            del self.meeting_fingerprints[meeting_id]
+            self.active_meetings.pop(meeting_id, None)
+            self.prompted_meetings.discard(meeting_id)
+            # An ended meeting's snooze (even "until all join") has nothing left to wait for
+            self.snoozed_meetings.pop(meeting_id, None)
+
+        checked = sorted(changed, key=lambda meeting_id: meetings_by_id[meeting_id].get('start_time') or '')
+        deferred = checked[self.max_status_checks:]
+        checked = checked[:self.max_status_checks]
+        if deferred:
+            logger.info("Deferring status checks for %s meetings to the next check", len(deferred))
+            # Keep the list fingerprint unset so the deferred meetings are picked up next time
+            self.meetings_fingerprint = None
+
+        for meeting_id in checked:
+            meeting_status = self.zoom_api.get_meeting_status(meeting_id)
+            if meeting_status and meeting_status.get('status') == 'started':
+                self.active_meetings[meeting_id] = meetings_by_id[meeting_id]
+                self.meeting_fingerprints[meeting_id] = fingerprints[meeting_id]
             else:
-                if self.isVisible():
-                    self.hide()
+                # Not confirmed live yet; forget its fingerprints so it is checked again next time
+                self.active_meetings.pop(meeting_id, None)
+                self.meeting_fingerprints.pop(meeting_id, None)
+                self.meetings_fingerprint = None
 
-        except Exception as e:
-            logger.error("Error in check_zoom_status: %s", str(e))
-            if self.isVisible():
-                self.hide()
+        return set(checked)
+
+    def _show_next_prompt(self):
+        """Show the prompt for the highest priority pending meeting, if any"""
+        if self.isVisible():
+            return
+
+        while self.pending_prompts:
+            _, meeting_id = heapq.heappop(self.pending_prompts)
+            self.queued_meetings.discard(meeting_id)
+
+            # Skip entries that went stale while queued
+            if (meeting_id not in self.active_meetings or
+                meeting_id in self.prompted_meetings or
+                meeting_id in self.snoozed_meetings):
+                continue
+
+            # Bind the prompt's buttons to this meeting
+            self.current_meeting_id = meeting_id
+            topic = self.active_meetings[meeting_id].get('topic')
+            if topic:
+                if len(topic) > 60:
+                    topic = topic[:57] + "..."
+                self.title_label.setText(f"Would you like to record \"{topic}\"?")
+            else:
+                self.title_label.setText("Would you like to record this meeting?")
+
+            # Center the window on the screen
+            screen = QApplication.primaryScreen().geometry()
+            self.move(
+                screen.center().x() - self.width() // 2,
+                screen.center().y() - self.height() // 2
+            )
+            self.show()
+            # Add to prompted meetings only when showing the window
+            self.prompted_meetings.add(meeting_id)
+            return
+
+    def finish_prompt(self):
+        """Hide the prompt and move on to the next pending meeting"""
+        self.hide()
+        self._show_next_prompt()
+
+    def _record_action(self, action, **details):
+        """Add the user's answer to the trace when traffic is being recorded"""
+        if self.zoom_api.recorder and self.current_meeting_id:
+            self.zoom_api.recorder.record_action(action, self.current_meeting_id, **details)
+
+    def decline(self):
+        """Dismiss the prompt without recording"""
+        self._record_action("no")
+        self.finish_prompt()
 
     def snooze(self):
         """Snooze the prompt based on selected option"""
         if not self.current_meeting_id:
-            self.hide()
+            self.finish_prompt()
             return
 
         if self.minutes_radio.isChecked():
             # Option 1: Snooze for X minutes
             snooze_minutes = self.snooze_spinbox.value()
+            self._record_action("snooze", mode="minutes", minutes=snooze_minutes)
             logger.info("User snoozed meeting %s for %s minutes",
                       self.current_meeting_id, snooze_minutes)
             # Store snooze expiry time
             self.snoozed_meetings[self.current_meeting_id] = (
-                datetime.now(UTC) + timedelta(minutes=snooze_minutes)
+                self._now() + timedelta(minutes=snooze_minutes)
             )
         else:
             # Option 2: Wait for all members
             logger.info("User snoozed meeting %s until all members join", self.current_meeting_id)
+            self._record_action("snooze", mode="all")
 
             # Get meeting details to log expected participants
             try:
@@ -602,7 +1549,8 @@ class ZoomRecordingPrompt(QMainWindow):
                     }
 
                     # Get meeting details
-                    response = requests.get(
+                    response = self.zoom_api.request(
+                        "GET",
                         f"{self.zoom_api.base_url}/meetings/{self.current_meeting_id}",
                         headers=headers
                     )
@@ -634,24 +1582,25 @@ class ZoomRecordingPrompt(QMainWindow):
         if self.current_meeting_id in self.prompted_meetings:
             self.prompted_meetings.remove(self.current_meeting_id)
 
-        self.hide()
+        self.finish_prompt()
 
     def start_recording(self):
         """Start recording the Zoom meeting"""
         try:
             if self.current_meeting_id:
                 logger.info("User requested to start recording for meeting: %s", self.current_meeting_id)
+                self._record_action("yes")
 
                 # First check if meeting is in progress
                 meeting_status = self.zoom_api.get_meeting_status(self.current_meeting_id)
                 if not meeting_status or meeting_status.get('status') != 'started':
                     logger.error("Meeting is not in progress, cannot start recording")
                     self.show_notification("Recording Error", "Meeting is not in progress. Cannot start recording.")
-                    self.hide()
+                    self.finish_prompt()
                     return
 
                 # Try using Zoom API first
-                if os.getenv('ENABLE_API', 'true').lower() == 'true':
+                if self.config.enable_api:
                     # Try to start recording using API
                     headers = {
                         "Authorization": f"Bearer {self.zoom_api.get_access_token()}",
@@ -659,7 +1608,8 @@ class ZoomRecordingPrompt(QMainWindow):
                     }
 
                     # Try to start recording directly
-                    response = requests.post(
+                    response = self.zoom_api.request(
+                        "POST",
                         f"{self.zoom_api.base_url}/live_meetings/{self.current_meeting_id}/events",
                         headers=headers,
                         json={"event": "recording.start", "setting": {"recording_type": "cloud"}}
@@ -668,7 +1618,7 @@ class ZoomRecordingPrompt(QMainWindow):
                     if response.status_code in [200, 201, 202, 204]:
                         logger.info("Recording started successfully via API")
                         self.show_notification("Recording Started", "Your Zoom meeting is now being recorded.")
-                        self.hide()
+                        self.finish_prompt()
                         return
                     else:
                         logger.error("Failed to start recording: %s", response.text)
@@ -684,7 +1634,7 @@ class ZoomRecordingPrompt(QMainWindow):
             # Fallback to keyboard shortcut
             self._execute_recording_keystrokes()
             self.show_notification("Recording Started", "Recording started using keyboard shortcut.")
-        self.hide()
+        self.finish_prompt()
 
     def _execute_recording_keystrokes(self):
         """Execute the keyboard shortcuts for recording based on OS"""
@@ -773,10 +1723,51 @@ class ZoomRecordingPrompt(QMainWindow):
         except Exception as e:
             logger.error("Error sending native notification: %s", str(e))
 
+def main_fleet(config):
+    logger.info("Starting Zoom Recording Prompt in fleet mode")
+    app = QCoreApplication(sys.argv)
+    recorder = open_trace_recorder(config.trace_file)
+    monitor = ZoomFleetMonitor(
+        ZoomAPI(config, pool_size=config.fleet_max_workers, recorder=recorder),
+        config.fleet_user_ids,
+        requests_per_second=config.fleet_requests_per_second,
+        max_workers=config.fleet_max_workers,
+        notify_url=config.fleet_notify_url
+    )
+    config_watcher = ConfigWatcher(config)
+    config_watcher.listeners.append(monitor.apply_config)
+    sys.exit(app.exec())
+
+def main_replay(config, trace_path, speed):
+    logger.info("Replaying Zoom API trace %s at %sx", trace_path, speed)
+    app = QApplication(sys.argv[:1])
+    # No recorder: a replay never writes a trace, even with ZOOM_TRACE_FILE set
+    window = ZoomRecordingPrompt(config)
+    replayer = TraceReplayer(trace_path, window.zoom_api.base_url, window.zoom_api.token_url)
+    replayer.run(window, config.check_interval, speed)
+
 def main():
+    config = Config.load()
+    parser = argparse.ArgumentParser(description="Prompt to record Zoom meetings you host")
+    parser.add_argument('--replay', metavar='TRACE',
+                        help="replay a trace recorded with ZOOM_TRACE_FILE instead of calling the API")
+    parser.add_argument('--speed', type=float, default=1.0,
+                        help="replay speed multiplier, 0 for as fast as possible (default: 1)")
+    args, _ = parser.parse_known_args()
+    if args.replay:
+        main_replay(config, args.replay, args.speed)
+        return
+
+    if config.fleet_user_ids:
+        main_fleet(config)
+        return
+
     logger.info("Starting Zoom Recording Prompt application")
     app = QApplication(sys.argv)
-    window = ZoomRecordingPrompt()
+    recorder = open_trace_recorder(config.trace_file)
+    window = ZoomRecordingPrompt(config, recorder=recorder)
+    config_watcher = ConfigWatcher(config)
+    config_watcher.listeners.append(window.apply_config)
     window.hide()  # Hide the window after initialization
     sys.exit(app.exec())
 